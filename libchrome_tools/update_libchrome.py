@@ -98,6 +98,10 @@ _IMPORT_BLACKLIST = [
     'third_party/protobuf/*',
 ]
 
+# Compiled matcher for _IMPORT_BLACKLIST, built once at import time.
+_IMPORT_BLACKLIST_RE = re.compile('|'.join(
+    '(?:%s)' % fnmatch.translate(pattern) for pattern in _IMPORT_BLACKLIST))
+
 def _find_target_files(chromium_root):
   """Returns target files to be upreved."""
   # Files in the repository should be updated.
@@ -108,9 +112,10 @@ def _find_target_files(chromium_root):
   # Files in _IMPORT_LIST are copied in the following section, so
   # exclude them from candidates, here, so that files deleted in chromium
   # repository will be deleted on update.
+  import_prefixes = tuple(_IMPORT_LIST)
   candidates = [
       path for path in output.splitlines()
-      if not any(path.startswith(import_path) for import_path in _IMPORT_LIST)]
+      if not path.startswith(import_prefixes)]
 
   # All files listed in _IMPORT_LIST should be imported, too.
   for import_path in _IMPORT_LIST:
@@ -129,10 +134,8 @@ def _find_target_files(chromium_root):
         candidates.append(os.path.relpath(filepath, chromium_root))
 
   # Apply blacklist.
-  exclude_pattern = re.compile('|'.join(
-      '(?:%s)' % fnmatch.translate(pattern) for pattern in _IMPORT_BLACKLIST))
   return [filepath for filepath in candidates
-          if not exclude_pattern.match(filepath)]
+          if not _IMPORT_BLACKLIST_RE.match(filepath)]
 
 
 def _clean_existing_dir(output_root):